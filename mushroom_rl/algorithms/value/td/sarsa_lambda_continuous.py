@@ -2,6 +2,7 @@ import numpy as np
 
 from mushroom_rl.algorithms.value.td import TD
 from mushroom_rl.approximators import Regressor
+from mushroom_rl.approximators.parametric import LinearApproximator, CMAC
 from mushroom_rl.utils.parameters import to_parameter
 
 
@@ -10,6 +11,8 @@ class SARSALambdaContinuous(TD):
     Continuous version of SARSA(lambda) algorithm.
 
     """
+    _trace_threshold = 1e-10
+
     def __init__(self, mdp_info, policy, approximator, learning_rate,
                  lambda_coeff, features, approximator_params=None):
         """
@@ -26,14 +29,43 @@ class SARSALambdaContinuous(TD):
         self.e = np.zeros(Q.weights_size)
         self._lambda = to_parameter(lambda_coeff)
 
+        self._sparse = self._use_sparse_update(features, Q)
+        self._e_idx = np.zeros(0, dtype=int)
+
         self._add_save_attr(
             _lambda='primitive',
-            e='numpy'
+            e='numpy',
+            _sparse='primitive',
+            _e_idx='numpy'
         )
 
         super().__init__(mdp_info, policy, Q, learning_rate, features)
 
+    def _post_load(self):
+        super()._post_load()
+
+        # Agents saved before the sparse update path do not store its state
+        if not hasattr(self, '_sparse'):
+            self._sparse = self._use_sparse_update(self.phi, self.Q)
+            self._add_save_attr(_sparse='primitive')
+        if not hasattr(self, '_e_idx'):
+            self._e_idx = np.flatnonzero(self.e)
+            self._add_save_attr(_e_idx='numpy')
+
+    @staticmethod
+    def _use_sparse_update(features, Q):
+        # With tile coding features and a linear Q-function, only the weights
+        # of the active tiles and the non-zero traces have to be updated.
+        return hasattr(features, 'compute_indexes') and \
+            Q.n_actions is not None and \
+            isinstance(Q.model, LinearApproximator) and \
+            not isinstance(Q.model, CMAC)
+
     def _update(self, state, action, reward, next_state, absorbing):
+        if self._sparse:
+            self._sparse_update(state, action, reward, next_state, absorbing)
+            return
+
         phi_state = self.phi(state)
         q_current = self.Q.predict(phi_state, action)
 
@@ -53,7 +85,40 @@ class SARSALambdaContinuous(TD):
         theta += alpha * delta * self.e
         self.Q.set_weights(theta)
 
+    def _sparse_update(self, state, action, reward, next_state, absorbing):
+        model = self.Q.model
+        n_phi = self.phi.size
+
+        idx_state = self.phi.compute_indexes(state)
+        q_current = model.sparse_predict(idx_state)[action[0]]
+
+        alpha = self._alpha(state, action)
+
+        # The traces below the threshold are dropped, so that the number of
+        # non-zero traces stays bounded
+        self.e[self._e_idx] *= self.mdp_info.gamma * self._lambda()
+        pruned = np.abs(self.e[self._e_idx]) < self._trace_threshold
+        self.e[self._e_idx[pruned]] = 0.
+        self._e_idx = self._e_idx[~pruned]
+
+        active = action[0] * n_phi + np.array(idx_state, dtype=int)
+        new_idx = active[self.e[active] == 0.]
+        self.e[active] += 1.
+        self._e_idx = np.concatenate([self._e_idx, new_idx])
+
+        self.next_action = self.draw_action(next_state)
+        if not absorbing:
+            idx_next_state = self.phi.compute_indexes(next_state)
+            q_next = model.sparse_predict(idx_next_state)[self.next_action[0]]
+        else:
+            q_next = 0.
+
+        delta = reward + self.mdp_info.gamma * q_next - q_current
+
+        model.sparse_update(self._e_idx, alpha * delta * self.e[self._e_idx])
+
     def episode_start(self):
         self.e = np.zeros(self.Q.weights_size)
+        self._e_idx = np.zeros(0, dtype=int)
 
         super().episode_start()
@@ -70,6 +70,34 @@ class LinearApproximator(Serializable):
 
         return prediction
 
+    def sparse_predict(self, indexes):
+        """
+        Predict the output of the model for a single input with binary
+        features, e.g. the ones computed by tile coding, given only the
+        indexes of the active features.
+
+        Args:
+            indexes (list): the indexes of the non-zero elements of the input.
+
+        Returns:
+            The prediction of the model.
+
+        """
+        return np.sum(self._w[:, indexes], axis=-1)
+
+    def sparse_update(self, indexes, delta):
+        """
+        Add ``delta`` to a subset of the weights, avoiding to update the whole
+        weights vector.
+
+        Args:
+            indexes (np.ndarray): the unique indexes of the weights to update,
+                using the same ordering of ``get_weights``;
+            delta (np.ndarray): the values to add to the selected weights.
+
+        """
+        self._w[np.unravel_index(indexes, self._w.shape)] += delta
+
     @property
     def weights_size(self):
         """
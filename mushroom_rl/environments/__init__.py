@@ -3,8 +3,10 @@ __extras__ = []
 from .environment import Environment, MDPInfo
 try:
     Atari = None
-    from .atari import Atari
+    VectorizedAtari = None
+    from .atari import Atari, VectorizedAtari
     __extras__.append('Atari')
+    __extras__.append('VectorizedAtari')
 except ImportError:
     pass
 
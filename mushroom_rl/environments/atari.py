@@ -1,6 +1,8 @@
-from copy import deepcopy
-from collections import deque
+import multiprocessing as mp
+import traceback
+import weakref
 
+import cv2
 import gym
 
 from mushroom_rl.environments import Environment, MDPInfo
@@ -10,35 +12,89 @@ from atariari.benchmark.wrapper import AtariARIWrapper, atari_dict
 
 
 class MaxAndSkip(gym.Wrapper):
+    """
+    Wrapper repeating each action for ``skip`` frames and pooling the last two
+    frames. The returned observation is an internal buffer that is overwritten
+    by the next call to ``step``, so it must be copied to be stored.
+
+    """
     def __init__(self, env, skip, max_pooling=True):
         gym.Wrapper.__init__(self, env)
         self._obs_buffer = np.zeros((2,) + env.observation_space.shape,
                                     dtype=np.uint8)
         self._skip = skip
+        self._pooling = skip >= 2
         self._max_pooling = max_pooling
+        if self._pooling:
+            self._frame = np.zeros(env.observation_space.shape,
+                                   dtype=np.uint8)
+            if not max_pooling:
+                self._sum = np.zeros(env.observation_space.shape,
+                                     dtype=np.uint16)
 
-    def reset(self):
-        return self.env.reset()
+        # The skipped frames are executed directly in the emulator, so the
+        # time limit of the wrapped environment is enforced here
+        self._ale = env.unwrapped.ale
+        self._action_set = env.unwrapped._action_set
+        self._max_episode_steps = np.inf
+        if env.spec is not None and env.spec.max_episode_steps is not None:
+            self._max_episode_steps = env.spec.max_episode_steps
+        self._elapsed_steps = 0
 
     def step(self, action):
+        ale_action = self._action_set[action]
         total_reward = 0.
+        truncated = False
         for i in range(self._skip):
-            obs, reward, absorbing, info = self.env.step(action)
+            total_reward += self._ale.act(ale_action)
+            self._elapsed_steps += 1
+            absorbing = self._ale.game_over()
             if i == self._skip - 2:
-                self._obs_buffer[0] = obs
+                self._ale.getScreenRGB2(self._obs_buffer[0])
             if i == self._skip - 1:
-                self._obs_buffer[1] = obs
-            total_reward += reward
+                self._ale.getScreenRGB2(self._obs_buffer[1])
+            if self._elapsed_steps >= self._max_episode_steps:
+                truncated = not absorbing
+                absorbing = True
             if absorbing:
                 break
-        if self._max_pooling:
-            frame = self._obs_buffer.max(axis=0)
+        # The pooled frame is written in a separate buffer, so that the raw
+        # frames are kept when the next step ends before the last frame
+        if not self._pooling:
+            frame = self._obs_buffer[1]
+        elif self._max_pooling:
+            frame = np.maximum(self._obs_buffer[0], self._obs_buffer[1],
+                               out=self._frame)
         else:
-            frame = self._obs_buffer.mean(axis=0)
+            np.add(self._obs_buffer[0], self._obs_buffer[1], out=self._sum,
+                   dtype=np.uint16)
+            frame = np.right_shift(self._sum, 1, out=self._frame,
+                                   casting='unsafe')
+
+        info = {'ale.lives': self._ale.lives()}
+        if truncated:
+            info['TimeLimit.truncated'] = True
 
         return frame, total_reward, absorbing, info
 
+    def skip_frames(self, action, n_frames):
+        """
+        Execute an action for a number of frames without observing the
+        screen. The frames count toward the time limit.
+
+        Args:
+            action (int): the action to execute;
+            n_frames (int): the number of frames.
+
+        """
+        ale_action = self._action_set[action]
+        for _ in range(n_frames):
+            self._ale.act(ale_action)
+        self._elapsed_steps += n_frames
+
     def reset(self, **kwargs):
+        self._elapsed_steps = 0
+
         return self.env.reset(**kwargs)
 
 
@@ -50,7 +106,8 @@ class Atari(Environment):
 
     """
     def __init__(self, name, width=84, height=84, ends_at_life=False,
-                 max_pooling=True, history_length=4, max_no_op_actions=30):
+                 max_pooling=True, history_length=4, max_no_op_actions=30,
+                 interpolation=cv2.INTER_LINEAR):
         """
         Constructor.
 
@@ -64,7 +121,10 @@ class Atari(Environment):
                 average-pooling of the last two frames when using NoFrameskip;
             history_length (int, 4): number of frames to form a state;
             max_no_op_actions (int, 30): maximum number of no-op action to
-                execute at the beginning of an episode.
+                execute at the beginning of an episode;
+            interpolation (int, cv2.INTER_LINEAR): the OpenCV interpolation
+                method used to resize the frames. ``cv2.INTER_NEAREST`` is
+                faster, but produces different frames.
 
         """
         # MPD creation
@@ -84,6 +144,7 @@ class Atari(Environment):
 
         # MDP parameters
         self._img_size = (width, height)
+        self._interpolation = interpolation
         self._episode_ends_at_life = ends_at_life
         self._max_lives = self.env.unwrapped.ale.lives()
         self._lives = self._max_lives
@@ -92,9 +153,18 @@ class Atari(Environment):
         self._max_no_op_actions = max_no_op_actions
         self._history_length = history_length
         self._current_no_op = None
+        self._state = None
+        self._ale = self.env.unwrapped.ale
+        self._frameskip = self.env.unwrapped.frameskip
+        self._no_op_action = self.env.unwrapped._action_set[0]
+        self._gray_buffer = np.empty(self.env.observation_space.shape[:2],
+                                     dtype=np.uint8)
         self.action_space = self.env.action_space
 
-        assert self.env.unwrapped.get_action_meanings()[0] == 'NOOP'
+        action_meanings = self.env.unwrapped.get_action_meanings()
+        assert action_meanings[0] == 'NOOP'
+        self._fire_on_reset = len(action_meanings) > 1 and \
+            action_meanings[1] == 'FIRE'
 
         # MDP properties
         action_space = Discrete(self.env.action_space.n)
@@ -108,27 +178,48 @@ class Atari(Environment):
 
     def reset(self, state=None):
         if self._real_reset:
-            self._state = preprocess_frame(self.env.reset(), self._img_size)
-            self._state = deque([deepcopy(
-                self._state) for _ in range(self._history_length)],
-                maxlen=self._history_length
-            )
+            frame = preprocess_frame(self.env.reset(), self._img_size,
+                                     self._gray_buffer,
+                                     interpolation=self._interpolation)
+            self._state = [frame] * self._history_length
             self._lives = self._max_lives
 
-        self._force_fire = self.env.unwrapped.get_action_meanings()[1] == 'FIRE'
+        self._force_fire = self._fire_on_reset
 
         self._current_no_op = np.random.randint(self._max_no_op_actions + 1)
 
-        return LazyFrames(list(self._state), self._history_length)
+        return LazyFrames(self._state, self._history_length)
 
     def step(self, action):
         # Force FIRE action to start episodes in games with lives
         if self._force_fire:
-            obs, _, _, _ = self.env.env.step(1)
+            if isinstance(self.env, MaxAndSkip):
+                self.env.skip_frames(1, 1)
+            else:
+                self.env.env.step(1)
             self._force_fire = False
-        while self._current_no_op > 0:
-            obs, _, _, _ = self.env.env.step(0)
-            self._current_no_op -= 1
+        # No-op actions are sent directly to the emulator, skipping the gym
+        # wrappers, as their observations are never used. Wrappers other than
+        # MaxAndSkip, e.g. the time limit of the augmented games, must still
+        # count them, so the no-op actions are executed through them
+        if self._current_no_op > 0:
+            if isinstance(self.env, MaxAndSkip) or \
+                    self.env.env is self.env.unwrapped:
+                if isinstance(self._frameskip, int):
+                    n_frames = self._current_no_op * self._frameskip
+                else:
+                    n_frames = self.env.unwrapped.np_random.randint(
+                        self._frameskip[0], self._frameskip[1],
+                        size=self._current_no_op).sum()
+                if isinstance(self.env, MaxAndSkip):
+                    self.env.skip_frames(0, n_frames)
+                else:
+                    for _ in range(n_frames):
+                        self._ale.act(self._no_op_action)
+            else:
+                for _ in range(self._current_no_op):
+                    self.env.env.step(0)
+            self._current_no_op = 0
 
         obs, reward, absorbing, info = self.env.step(action)
         self._real_reset = absorbing
@@ -136,15 +227,16 @@ class Atari(Environment):
             if self._episode_ends_at_life:
                 absorbing = True
             self._lives = info['ale.lives']
-            self._force_fire = self.env.unwrapped.get_action_meanings()[
-                1] == 'FIRE'
+            self._force_fire = self._fire_on_reset
 
-        self._state.append(preprocess_frame(obs, self._img_size))
+        del self._state[0]
+        self._state.append(preprocess_frame(
+            obs, self._img_size, self._gray_buffer,
+            interpolation=self._interpolation))
+        state = LazyFrames(self._state, self._history_length)
         if self.augmented:
-            return LazyFrames(list(self._state),
-                              self._history_length), reward, absorbing, info, obs
-        return LazyFrames(list(self._state),
-                          self._history_length), reward, absorbing, info
+            return state, reward, absorbing, info, obs
+        return state, reward, absorbing, info
 
     def render(self, mode='human'):
         return self.env.render(mode=mode)
@@ -163,3 +255,198 @@ class Atari(Environment):
 
         """
         self._episode_ends_at_life = ends_at_life
+
+
+def _atari_worker(remote, parent_remote, shared_obs, shape, idx, name,
+                  atari_params):
+    parent_remote.close()
+    obs = np.frombuffer(shared_obs, dtype=np.uint8).reshape(shape)[idx]
+
+    # Forked workers inherit the random state of the parent, so they would
+    # draw the same number of no-op actions
+    np.random.seed()
+
+    try:
+        mdp = Atari(name, **atari_params)
+    except Exception:
+        remote.send((False, traceback.format_exc()))
+        remote.close()
+        return
+    remote.send((True, None))
+
+    try:
+        while True:
+            cmd, data = remote.recv()
+            if cmd == 'close':
+                break
+            try:
+                result = None
+                if cmd == 'step':
+                    state, reward, absorbing, info = mdp.step(data)[:4]
+                    if absorbing:
+                        info['terminal_observation'] = np.array(state)
+                        state = mdp.reset()
+                    obs[:] = state
+                    result = reward, absorbing, info
+                elif cmd == 'reset':
+                    obs[:] = mdp.reset()
+                elif cmd == 'seed':
+                    np.random.seed(data)
+                    mdp.seed(data)
+                else:
+                    raise ValueError('Unknown command: ' + str(cmd))
+                remote.send((True, result))
+            except Exception:
+                remote.send((False, traceback.format_exc()))
+    finally:
+        mdp.stop()
+        remote.close()
+
+
+def _stop_workers(remotes, processes):
+    for remote in remotes:
+        try:
+            remote.send(('close', None))
+        except OSError:
+            # The worker has already terminated
+            pass
+    for p in processes:
+        p.join()
+
+
+class VectorizedAtari(object):
+    """
+    Collection of Atari environments, each one running in a separate process,
+    that are stepped together. The observations of all the environments are
+    written by the workers in a single shared memory array, avoiding the
+    serialization of the frames between processes. An environment reaching an
+    absorbing state is reset automatically by its worker.
+
+    """
+    def __init__(self, name, n_envs, **atari_params):
+        """
+        Constructor.
+
+        Args:
+            name (str): id name of the Atari game in Gym;
+            n_envs (int): number of environments to run in parallel;
+            **atari_params: other parameters used to build each ``Atari``
+                environment.
+
+        """
+        assert n_envs > 0
+
+        self.n_envs = n_envs
+
+        mdp = Atari(name, **atari_params)
+        self._mdp_info = mdp.info
+        mdp.stop()
+
+        shape = (n_envs,) + self._mdp_info.observation_space.shape
+        shared_obs = mp.RawArray('B', int(np.prod(shape)))
+        self._obs = np.frombuffer(shared_obs, dtype=np.uint8).reshape(shape)
+
+        self._remotes, work_remotes = zip(*[mp.Pipe() for _ in range(n_envs)])
+        self._processes = list()
+        for i, (remote, work_remote) in enumerate(zip(self._remotes,
+                                                      work_remotes)):
+            p = mp.Process(target=_atari_worker,
+                           args=(work_remote, remote, shared_obs, shape, i,
+                                 name, atari_params),
+                           daemon=True)
+            p.start()
+            work_remote.close()
+            self._processes.append(p)
+
+        self._finalizer = weakref.finalize(self, _stop_workers, self._remotes,
+                                           self._processes)
+        self._receive()
+
+    def reset(self):
+        """
+        Reset all the environments.
+
+        Returns:
+            The array of the initial states of the environments. The array is
+            a view of the shared memory and is overwritten by the next call to
+            ``reset`` or ``step``.
+
+        """
+        self._broadcast('reset', [None] * self.n_envs)
+
+        return self._obs
+
+    def step(self, actions):
+        """
+        Move all the environments according to the provided actions. The
+        environments reaching an absorbing state are reset, and their last
+        state is stored in the ``terminal_observation`` entry of their
+        additional dictionary.
+
+        Args:
+            actions (np.ndarray): the action to execute in each environment.
+
+        Returns:
+            The array of the states reached by the environments, the array of
+            the rewards, the array of the absorbing flags and the list of the
+            additional dictionaries. The array of states is a view of the
+            shared memory and is overwritten by the next call to ``reset`` or
+            ``step``.
+
+        """
+        assert len(actions) == self.n_envs
+
+        results = self._broadcast('step', actions)
+        rewards, absorbing, infos = zip(*results)
+
+        return self._obs, np.array(rewards), np.array(absorbing), list(infos)
+
+    def seed(self, seed):
+        """
+        Set the seed of the environments. Each environment receives a
+        different seed, obtained adding its index to ``seed``, that is used
+        also to seed the numpy random generator of its process.
+
+        Args:
+            seed (int): the value of the seed.
+
+        """
+        self._broadcast('seed', [seed + i for i in range(self.n_envs)])
+
+    def stop(self):
+        """
+        Terminate the worker processes. This is done automatically also when
+        the object is garbage collected.
+
+        """
+        self._finalizer()
+
+    @property
+    def info(self):
+        """
+        Returns:
+             An object containing the info of each environment.
+
+        """
+        return self._mdp_info
+
+    def _broadcast(self, cmd, data):
+        for remote, d in zip(self._remotes, data):
+            remote.send((cmd, d))
+
+        return self._receive()
+
+    def _receive(self):
+        results = list()
+        error = None
+        for i, remote in enumerate(self._remotes):
+            success, result = remote.recv()
+            if not success and error is None:
+                error = RuntimeError(
+                    'Error in the environment {}:\n{}'.format(i, result))
+            results.append(result)
+
+        if error is not None:
+            raise error
+
+        return results
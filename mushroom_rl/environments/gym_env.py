@@ -50,6 +50,10 @@ class Gym(Environment):
 
         self.env = gym.make(name, **env_args)
 
+        # The gym time limit is ignored, as the horizon is managed by mushroom
+        if isinstance(self.env, gym.wrappers.TimeLimit):
+            self.env = self.env.env
+
         if wrappers is not None:
             if wrappers_args is None:
                 wrappers_args = [dict()] * len(wrappers)
@@ -59,8 +63,6 @@ class Gym(Environment):
                 else:
                     self.env = wrapper(self.env, *args, **env_args)
 
-        self.env._max_episode_steps = np.inf  # Hack to ignore gym time limit.
-
         # MDP properties
         assert not isinstance(self.env.observation_space,
                               gym_spaces.MultiDiscrete)
@@ -70,16 +72,20 @@ class Gym(Environment):
         observation_space = self._convert_gym_space(self.env.observation_space)
         mdp_info = MDPInfo(observation_space, action_space, gamma, horizon)
 
-        if isinstance(action_space, Discrete):
-            self._convert_action = lambda a: a[0]
+        self._discrete_action = isinstance(action_space, Discrete)
+
+        if isinstance(observation_space, Discrete):
+            self._convert_observation = lambda obs: np.array([obs])
+        elif len(observation_space.shape) > 0:
+            self._convert_observation = lambda obs: obs
         else:
-            self._convert_action = lambda a: a
+            self._convert_observation = np.atleast_1d
 
         super().__init__(mdp_info)
 
     def reset(self, state=None):
         if state is None:
-            return np.atleast_1d(self.env.reset())
+            return self._convert_observation(self.env.reset())
         else:
             self.env.reset()
             self.env.state = state
@@ -87,10 +93,11 @@ class Gym(Environment):
             return np.atleast_1d(state)
 
     def step(self, action):
-        action = self._convert_action(action)
+        if self._discrete_action:
+            action = action[0]
         obs, reward, absorbing, info = self.env.step(action)
 
-        return np.atleast_1d(obs), reward, absorbing, info
+        return self._convert_observation(obs), reward, absorbing, info
 
     def render(self, mode='human'):
         if self._first or self._not_pybullet:
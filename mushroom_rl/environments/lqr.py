@@ -53,6 +53,8 @@ class LQR(Environment):
         self._max_action = max_action
         self._episodic = episodic
         self.random_init = random_init
+        self._bounded_state = np.any(np.isfinite(max_pos))
+        self._bounded_action = np.any(np.isfinite(max_action))
 
         self._initial_state = initial_state
 
@@ -130,15 +132,18 @@ class LQR(Environment):
 
     def step(self, action):
         x = self._state
-        u = self._bound(action, self.info.action_space.low,
-                        self.info.action_space.high)
+        if self._bounded_action:
+            u = self._bound(action, self.info.action_space.low,
+                            self.info.action_space.high)
+        else:
+            u = action
 
         reward = -(x.dot(self.Q).dot(x) + u.dot(self.R).dot(u))
         self._state = self.A.dot(x) + self.B.dot(u)
 
         absorbing = False
 
-        if np.any(np.abs(self._state) > self._max_pos):
+        if self._bounded_state and np.any(np.abs(self._state) > self._max_pos):
             if self._episodic:
                 reward = -self._max_pos ** 2 * 10
                 absorbing = True
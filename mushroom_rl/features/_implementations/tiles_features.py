@@ -1,5 +1,6 @@
 import numpy as np
 
+from mushroom_rl.features.tiles import Tiles
 from .features_implementation import FeaturesImplementation
 
 
@@ -15,12 +16,33 @@ class TilesFeatures(FeaturesImplementation):
         for tiling in self._tiles:
             self._size += tiling.size
 
+        self._vectorized = self._can_vectorize(self._tiles)
+
+        if self._vectorized:
+            self._stack_tilings()
+
+    def __getstate__(self):
+        # Only the tilings are serialized, the stacked arrays are rebuilt
+        return dict(_tiles=self._tiles)
+
+    def __setstate__(self, state):
+        self.__init__(state['_tiles'])
+
     def __call__(self, *args):
         x = self._concatenate(args)
 
+        x = np.atleast_2d(x)
+
+        if self._vectorized:
+            indexes, valid = self._compute_indexes_vectorized(x)
+            y = np.zeros((x.shape[0], self._size))
+            rows, cols = np.nonzero(valid)
+            y[rows, indexes[rows, cols]] = 1.
+
+            return y[0] if len(y) == 1 else y
+
         y = list()
 
-        x = np.atleast_2d(x)
         for s in x:
             out = np.zeros(self._size)
 
@@ -45,9 +67,16 @@ class TilesFeatures(FeaturesImplementation):
     def compute_indexes(self, *args):
         x = self._concatenate(args)
 
+        x = np.atleast_2d(x)
+
+        if self._vectorized:
+            indexes, valid = self._compute_indexes_vectorized(x)
+            y = [idx[v].tolist() for idx, v in zip(indexes, valid)]
+
+            return y[0] if len(y) == 1 else y
+
         y = list()
 
-        x = np.atleast_2d(x)
         for s in x:
             out = list()
 
@@ -67,6 +96,74 @@ class TilesFeatures(FeaturesImplementation):
         else:
              return y
 
+    def _compute_indexes_vectorized(self, x):
+        """
+        Compute the index of the active tile of every tiling for each sample,
+        with a single set of array operations over all the tilings.
+
+        Args:
+            x (np.ndarray): the 2-dimensional array of samples.
+
+        Returns:
+            The array of the feature indexes of the active tiles, and the mask
+            of the tilings that contain each sample.
+
+        """
+        if self._state_components is not None:
+            x = x[:, self._state_components]
+        else:
+            # As in Tiles, only the leading components of the input are used
+            x = x[:, :self._n_tiles.shape[1]]
+        x = x[:, np.newaxis, :]
+
+        valid = np.all((self._low <= x) & (x < self._high), axis=-1)
+        components = self._n_tiles * (x - self._low) / self._width
+        # The samples outside a tiling, possibly non-finite, are masked
+        # before the cast to integer
+        components[~valid] = 0.
+        indexes = np.sum(np.floor(components).astype(int) * self._multipliers,
+                         axis=-1)
+
+        return indexes + self._offsets, valid
+
+    def _stack_tilings(self):
+        """
+        Stack the parameters of all the tilings in read-only arrays.
+
+        """
+        self._state_components = self._tiles[0].state_components
+        self._low = np.array([t.low for t in self._tiles])
+        self._high = np.array([t.high for t in self._tiles])
+        self._width = self._high - self._low
+        self._n_tiles = np.array([t.n_tiles for t in self._tiles])
+        self._multipliers = np.cumprod(
+            np.concatenate([np.ones((len(self._tiles), 1), dtype=int),
+                            self._n_tiles[:, :-1]], axis=1), axis=1)
+        self._offsets = np.cumsum([0] + [t.size for t in self._tiles[:-1]])
+
+        for array in [self._low, self._high, self._width, self._n_tiles,
+                      self._multipliers, self._offsets]:
+            array.setflags(write=False)
+
+    @staticmethod
+    def _can_vectorize(tiles):
+        if len(tiles) == 0 or not all(type(t) is Tiles for t in tiles):
+            return False
+
+        n_dims = len(tiles[0].n_tiles)
+        state_components = tiles[0].state_components
+
+        for t in tiles:
+            if len(t.n_tiles) != n_dims:
+                return False
+            if state_components is None or t.state_components is None:
+                if t.state_components is not state_components:
+                    return False
+            elif not np.array_equal(t.state_components, state_components):
+                return False
+
+        return True
+
     @property
     def size(self):
         return self._size
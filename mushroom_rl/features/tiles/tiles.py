@@ -126,3 +126,40 @@ class Tiles:
     @property
     def size(self):
         return self._size
+
+    @property
+    def low(self):
+        """
+        Returns:
+             The lowest value of the tiling for each dimension.
+
+        """
+        return np.array([r[0] for r in self._range])
+
+    @property
+    def high(self):
+        """
+        Returns:
+             The highest value of the tiling for each dimension.
+
+        """
+        return np.array([r[1] for r in self._range])
+
+    @property
+    def n_tiles(self):
+        """
+        Returns:
+             The number of tiles for each dimension.
+
+        """
+        return np.array(self._n_tiles)
+
+    @property
+    def state_components(self):
+        """
+        Returns:
+             The dimensions of the input considered by the tiling, or None if
+             all the dimensions are considered.
+
+        """
+        return self._state_components
@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 
 def value_iteration(prob, reward, gamma, eps):
@@ -22,7 +21,7 @@ def value_iteration(prob, reward, gamma, eps):
     value = np.zeros(n_states)
 
     while True:
-        value_old = deepcopy(value)
+        value_old = value.copy()
 
         for state in range(n_states):
             vmax = -np.inf
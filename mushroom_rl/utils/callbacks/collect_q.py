@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 from mushroom_rl.utils.callbacks.callback import Callback
 from mushroom_rl.utils.table import EnsembleTable
@@ -29,6 +28,6 @@ class CollectQ(Callback):
             qs = list()
             for m in self._approximator.model:
                 qs.append(m.table)
-            self._data_list.append(deepcopy(np.mean(qs, 0)))
+            self._data_list.append(np.mean(qs, 0))
         else:
-            self._data_list.append(deepcopy(self._approximator.table))
+            self._data_list.append(self._approximator.table.copy())
@@ -161,21 +161,26 @@ def compute_J(dataset, gamma=1.):
         The cumulative discounted reward of each episode in the dataset.
 
     """
-    js = list()
-
-    j = 0.
-    episode_steps = 0
-    for i in range(len(dataset)):
-        j += gamma ** episode_steps * dataset[i][2]
-        episode_steps += 1
-        if dataset[i][-1] or i == len(dataset) - 1:
-            js.append(j)
-            j = 0.
-            episode_steps = 0
-
-    if len(js) == 0:
+    if len(dataset) == 0:
         return [0.]
-    return js
+
+    rewards = np.array([sample[2] for sample in dataset], dtype=float)
+    last = np.array([sample[-1] for sample in dataset], dtype=bool)
+    last[-1] = True
+
+    ends = np.flatnonzero(last) + 1
+    starts = np.concatenate(([0], ends[:-1]))
+    lengths = ends - starts
+
+    gamma_pow = np.array([gamma ** k for k in range(np.max(lengths))])
+    episode_steps = np.arange(len(dataset)) - np.repeat(starts, lengths)
+
+    # The discount factors are broadcast over the components of vector rewards
+    discounts = gamma_pow[episode_steps].reshape(
+        (-1,) + (1,) * (rewards.ndim - 1))
+    js = np.add.reduceat(discounts * rewards, starts, axis=0)
+
+    return js.tolist() if rewards.ndim == 1 else list(js)
 
 
 def compute_metrics(dataset, gamma=1.):
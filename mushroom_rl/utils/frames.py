@@ -16,16 +16,25 @@ class LazyFrames(object):
 
     """
     def __init__(self, frames, history_length):
-        self._frames = frames
+        """
+        Constructor.
+
+        Args:
+            frames (list): sequence of frames. The references to the frames
+                are copied, so the sequence can be modified afterwards;
+            history_length (int): number of frames.
+
+        """
+        self._frames = list(frames)
 
         assert len(self._frames) == history_length
 
-    def __array__(self, dtype=None):
-        out = np.array(self._frames)
-        if dtype is not None:
-            out = out.astype(dtype)
+    def __array__(self, dtype=None, copy=None):
+        if copy is False:
+            raise ValueError('LazyFrames cannot be converted to an array '
+                             'without a copy')
 
-        return out
+        return np.array(self._frames, dtype=dtype)
 
     def copy(self):
         return self
@@ -35,19 +44,25 @@ class LazyFrames(object):
         return (len(self._frames),) + self._frames[0].shape
 
 
-def preprocess_frame(obs, img_size):
+def preprocess_frame(obs, img_size, gray_buffer=None,
+                     interpolation=cv2.INTER_LINEAR):
     """
     Convert a frame from rgb to grayscale and resize it.
 
     Args:
         obs (np.ndarray): array representing an rgb frame;
-        img_size (tuple): target size for images.
+        img_size (tuple): target size for images;
+        gray_buffer (np.ndarray, None): 8 bit integer array, with the same
+            height and width of ``obs``, used to store the intermediate
+            grayscale image. If None, a new array is allocated;
+        interpolation (int, cv2.INTER_LINEAR): the OpenCV interpolation method
+            used to resize the frame, e.g. ``cv2.INTER_NEAREST`` for a faster
+            nearest-neighbor resize.
 
     Returns:
         The transformed frame as 8 bit integer array.
 
     """
-    image = cv2.cvtColor(obs, cv2.COLOR_RGB2GRAY)
-    image = cv2.resize(image, img_size, interpolation=cv2.INTER_LINEAR)
+    image = cv2.cvtColor(obs, cv2.COLOR_RGB2GRAY, dst=gray_buffer)
 
-    return np.array(image, dtype=np.uint8)
+    return cv2.resize(image, img_size, interpolation=interpolation)
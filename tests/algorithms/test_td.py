@@ -388,6 +388,38 @@ def test_sarsa_lambda_continuous_linear():
     assert np.allclose(agent.Q.get_weights(), test_w)
 
 
+def test_sarsa_lambda_continuous_linear_sparse():
+    weights = list()
+    for sparse in [True, False]:
+        pi, _, mdp_continuous = initialize()
+        mdp_continuous.seed(1)
+        tilings = Tiles.generate(3, [4, 4],
+                                 mdp_continuous.info.observation_space.low,
+                                 mdp_continuous.info.observation_space.high)
+        features = Features(tilings=tilings)
+
+        approximator_params = dict(
+            input_shape=(features.size,),
+            output_shape=(mdp_continuous.info.action_space.n,),
+            n_actions=mdp_continuous.info.action_space.n
+        )
+        agent = SARSALambdaContinuous(mdp_continuous.info, pi,
+                                      LinearApproximator, Parameter(.1), .9,
+                                      features=features,
+                                      approximator_params=approximator_params)
+        assert agent._sparse
+        agent._sparse = sparse
+
+        core = Core(agent, mdp_continuous)
+
+        # Train long enough for the traces to be pruned
+        core.learn(n_steps=3000, n_steps_per_fit=1, quiet=True)
+
+        weights.append(agent.Q.get_weights())
+
+    assert np.allclose(weights[0], weights[1])
+
+
 def test_sarsa_lambda_continuous_linear_save(tmpdir):
     agent_path = tmpdir / 'agent_{}'.format(datetime.now().strftime("%H%M%S%f"))
 
@@ -423,6 +455,42 @@ def test_sarsa_lambda_continuous_linear_save(tmpdir):
         tu.assert_eq(save_attr, load_attr)
 
 
+def test_sarsa_lambda_continuous_linear_load_legacy(tmpdir):
+    agent_path = tmpdir / 'agent_{}'.format(datetime.now().strftime("%H%M%S%f"))
+
+    pi, _, mdp_continuous = initialize()
+    mdp_continuous.seed(1)
+    tilings = Tiles.generate(1, [2, 2],
+                             mdp_continuous.info.observation_space.low,
+                             mdp_continuous.info.observation_space.high)
+    features = Features(tilings=tilings)
+
+    approximator_params = dict(
+        input_shape=(features.size,),
+        output_shape=(mdp_continuous.info.action_space.n,),
+        n_actions=mdp_continuous.info.action_space.n
+    )
+    agent_save = SARSALambdaContinuous(mdp_continuous.info, pi,
+                                       LinearApproximator, Parameter(.1), .9,
+                                       features=features,
+                                       approximator_params=approximator_params)
+
+    core = Core(agent_save, mdp_continuous)
+    core.learn(n_steps=10, n_steps_per_fit=1, quiet=True)
+
+    # Emulate an agent saved without the state of the sparse update path
+    for att in ['_sparse', '_e_idx']:
+        del agent_save._save_attributes[att]
+    agent_save.save(agent_path)
+    agent_load = Agent.load(agent_path)
+
+    assert agent_load._sparse
+    assert np.array_equal(agent_load._e_idx, np.flatnonzero(agent_save.e))
+
+    core = Core(agent_load, mdp_continuous)
+    core.learn(n_steps=10, n_steps_per_fit=1, quiet=True)
+
+
 def test_sarsa_lambda_continuous_nn():
     pi, _, mdp_continuous = initialize()
     mdp_continuous.seed(1)
@@ -84,3 +84,25 @@ def test_linear_approximator():
     gradient_test = np.array([0.88471362, 0.11666548, 0.45466254, 0., 0., 0.])
 
     assert np.allclose(gradient, gradient_test)
+
+
+def test_linear_approximator_sparse():
+    np.random.seed(1)
+
+    approximator = LinearApproximator(weights=np.random.randn(2, 6),
+                                      input_shape=(6,), output_shape=(2,))
+
+    indexes = [1, 4]
+    x = np.zeros((1, 6))
+    x[0, indexes] = 1.
+
+    y = approximator.sparse_predict(indexes)
+    assert np.allclose(y, approximator.predict(x)[0])
+
+    w = approximator.get_weights()
+    update_indexes = np.array([1, 10])
+    delta = np.array([.5, -2.])
+    approximator.sparse_update(update_indexes, delta)
+    w[update_indexes] += delta
+
+    assert np.array_equal(approximator.get_weights(), w)
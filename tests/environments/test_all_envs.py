@@ -1,6 +1,6 @@
 import numpy as np
 
-from mushroom_rl.environments.atari import Atari
+from mushroom_rl.environments.atari import Atari, VectorizedAtari
 from mushroom_rl.environments.car_on_hill import CarOnHill
 from mushroom_rl.environments.cart_pole import CartPole
 from mushroom_rl.environments.generators import generate_grid_world,\
@@ -36,6 +36,47 @@ def test_atari():
     assert np.allclose(ns, ns_test)
 
 
+def test_vectorized_atari():
+    np.random.seed(1)
+    mdp = VectorizedAtari(name='PongDeterministic-v4', n_envs=2)
+    mdp.seed(1)
+    states = mdp.reset()
+    assert states.shape == (2, 4, 84, 84)
+
+    for i in range(10):
+        actions = np.random.randint(mdp.info.action_space.n, size=(2, 1))
+        ns, r, ab, info = mdp.step(actions)
+    mdp.stop()
+
+    assert ns.shape == (2, 4, 84, 84)
+    assert r.shape == (2,) and ab.shape == (2,) and len(info) == 2
+
+
+def test_vectorized_atari_consistency():
+    seed = 3
+    n_envs = 2
+    mdp = VectorizedAtari(name='PongDeterministic-v4', n_envs=n_envs)
+    mdp.seed(seed)
+    actions = np.random.RandomState(1).randint(mdp.info.action_space.n,
+                                               size=(10, n_envs, 1))
+    states = [mdp.reset().copy()]
+    for a in actions:
+        states.append(mdp.step(a)[0].copy())
+    mdp.stop()
+
+    for i in range(n_envs):
+        single_mdp = Atari(name='PongDeterministic-v4')
+        np.random.seed(seed + i)
+        single_mdp.seed(seed + i)
+        single_states = [np.array(single_mdp.reset())]
+        for a in actions:
+            single_states.append(np.array(single_mdp.step(a[i])[0]))
+        single_mdp.stop()
+
+        for state, single_state in zip(states, single_states):
+            assert np.array_equal(state[i], single_state)
+
+
 def test_car_on_hill():
     np.random.seed(1)
     mdp = CarOnHill()
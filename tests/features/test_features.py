@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 
 from mushroom_rl.features import Features
@@ -29,6 +31,58 @@ def test_tiles():
         assert features.size == y[i].size
 
 
+def test_tiles_vectorized():
+    tilings = Tiles.generate(3, [3, 4],
+                             np.array([0., -.5]),
+                             np.array([1., .5]))
+    tilings += Tiles.generate(2, [5, 2],
+                              np.array([-.1, -.3]),
+                              np.array([.8, .6]))
+    features = Features(tilings=tilings)
+
+    x = 1.4 * np.random.rand(20, 2) + [-.2, -.7]
+
+    indexes = features.compute_indexes(x)
+    y = features(x)
+
+    for i, x_i in enumerate(x):
+        indexes_test = list()
+        offset = 0
+        for tiling in tilings:
+            index = tiling(x_i)
+            if index is not None:
+                indexes_test.append(index + offset)
+            offset += tiling.size
+
+        y_test = np.zeros(features.size)
+        y_test[indexes_test] = 1.
+
+        assert indexes[i] == indexes_test
+        assert np.all(y[i] == y_test)
+
+    x_wide = np.concatenate([x, np.random.rand(20, 2)], axis=1)
+    assert features.compute_indexes(x_wide) == indexes
+    assert np.all(features(x_wide) == y)
+
+    x_invalid = np.array([[np.nan, 0.], [np.inf, 0.], [1e300, 0.]])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert features.compute_indexes(x_invalid) == [[], [], []]
+        assert np.all(features(x_invalid) == 0.)
+
+
+def test_tiles_subclass():
+    class FirstTile(Tiles):
+        def __call__(self, x):
+            return 0
+
+    tilings = [FirstTile([[0., 1.], [0., 1.]], [2, 2])
+               for _ in range(2)]
+    features = Features(tilings=tilings)
+
+    assert features.compute_indexes(np.array([.7, .7])) == [0, 4]
+
+
 def test_tiles_voronoi():
     tilings_list = [
         VoronoiTiles.generate(3, 10,
@@ -58,3 +58,29 @@ def test_dataset_utils():
     assert max_J == 0.2781283894436937
     assert mean_J == 0.1396447262570234
     assert n_episodes == 2
+
+
+def test_compute_J_array_rewards():
+    dataset = list()
+    for reward, last in zip([1., 2., 3., 4., 5.], [0, 0, 1, 0, 1]):
+        dataset.append((np.zeros(1), np.zeros(1), np.array([reward]),
+                        np.zeros(1), last, last))
+
+    J = compute_J(dataset, .5)
+
+    assert len(J) == 2
+    assert np.allclose(J[0], [1. + .5 * 2. + .25 * 3.])
+    assert np.allclose(J[1], [4. + .5 * 5.])
+
+
+def test_compute_J_vector_rewards():
+    dataset = list()
+    for reward, last in zip([1., 2., 3., 4., 5.], [0, 0, 1, 0, 1]):
+        dataset.append((np.zeros(1), np.zeros(1), np.array([reward, -reward]),
+                        np.zeros(1), last, last))
+
+    J = compute_J(dataset, .5)
+
+    assert len(J) == 2
+    assert np.allclose(J[0], [2.75, -2.75])
+    assert np.allclose(J[1], [6.5, -6.5])
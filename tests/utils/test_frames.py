@@ -0,0 +1,44 @@
+import warnings
+from collections import deque
+
+import numpy as np
+import pytest
+
+from mushroom_rl.utils.frames import LazyFrames
+
+
+def test_lazy_frames():
+    frames = [np.full((2, 3), i, dtype=np.uint8) for i in range(4)]
+    frames_test = np.array(frames)
+
+    for sequence in [frames, deque(frames), frames_test]:
+        state = LazyFrames(sequence, 4)
+        assert state.shape == (4, 2, 3)
+        assert np.array_equal(state, frames_test)
+
+
+def test_lazy_frames_dtype():
+    frames = [np.full((2, 3), i, dtype=np.uint8) for i in range(4)]
+    state = LazyFrames(frames, 4)
+
+    array = np.asarray(state)
+    assert array.dtype == np.uint8
+
+    array = np.asarray(state, dtype=np.float32)
+    assert array.dtype == np.float32
+    assert np.array_equal(array, np.array(frames, dtype=np.float32))
+
+
+def test_lazy_frames_copy():
+    frames = [np.full((2, 3), i, dtype=np.uint8) for i in range(4)]
+    state = LazyFrames(frames, 4)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        array = np.array(state)
+
+    assert np.array_equal(array, np.array(frames))
+
+    if np.lib.NumpyVersion(np.__version__) >= '2.0.0':
+        with pytest.raises(ValueError):
+            np.array(state, copy=False)